@@ -7,6 +7,7 @@ import pickle
 import base64
 import asyncio
 import subprocess
+import concurrent.futures
 import pandas as pd
 import streamlit as st
 from pathlib import Path
@@ -31,6 +32,11 @@ install_playwright_browsers()
 
 
 
+# Shared pool for remote calls (GitHub listing, Firecrawl scrapes) so slow
+# network work doesn't serialize behind the render cycle
+_EXEC = concurrent.futures.ThreadPoolExecutor(max_workers=8)
+
+
 # -------------------- STYLE VARIABLES --------------------
 PRIMARY_COLOR = "#1ABC9C"
 SECONDARY_COLOR = "#888888"
@@ -999,8 +1005,12 @@ def generate_hypotheses(target_url, optimization, kpi, reference_upload): # not
 
 # -------------------- SESSION STATE INIT -------------------- # not used
 if "dashboard_history" not in st.session_state:
-    # Load from GitHub repository on startup
-    st.session_state.dashboard_history = load_hypotheses_from_github()
+    # Load from GitHub in the background so the first render isn't blocked
+    # on the API; the future resolves on a later rerun once it's done
+    if "_dashboard_history_future" not in st.session_state:
+        st.session_state._dashboard_history_future = _EXEC.submit(load_hypotheses_from_github)
+    elif st.session_state._dashboard_history_future.done():
+        st.session_state.dashboard_history = st.session_state.pop("_dashboard_history_future").result()
 
 if "generated_hypotheses" not in st.session_state:
     st.session_state.generated_hypotheses = []
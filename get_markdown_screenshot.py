@@ -1,272 +1,348 @@
-from pathlib import Path
-from typing import Tuple, Optional
-import os, re,io,base64,gzip
-import asyncio
-from playwright.sync_api import sync_playwright, TimeoutError as PWTimeout
-from readability import Document
-from bs4 import BeautifulSoup
-from markdownify import markdownify as md
-from PIL import Image
-
-# Fix for Microsoft Store Python subprocess issues
-if os.name == 'nt':  # Windows
-    asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
- 
-def _find_edge_exe() -> Optional[str]:
-    """Try to locate Edge; override by setting EDGE_PATH."""
-    if os.getenv("EDGE_PATH") and Path(os.getenv("EDGE_PATH")).exists():
-        return os.getenv("EDGE_PATH")
-    candidates = []
-    pf = os.environ.get("PROGRAMFILES")
-    if pf:    candidates.append(Path(pf) / "Microsoft" / "Edge" / "Application" / "msedge.exe")
-    pfx = os.environ.get("PROGRAMFILES(X86)")
-    if pfx:   candidates.append(Path(pfx) / "Microsoft" / "Edge" / "Application" / "msedge.exe")
-    local = os.environ.get("LOCALAPPDATA")
-    if local: candidates.append(Path(local) / "Microsoft" / "Edge" / "Application" / "msedge.exe")
-    for c in candidates:
-        if c.exists(): return str(c)
-    return None
- 
-def _try_click_common_cookie_buttons(page, timeout_ms=1500) -> bool:
-    """
-    Try the obvious 'accept' buttons (page + iframes).
-    Returns True if something got clicked.
-    """
-    # Common button texts and multilingual variants (regex, partial match)
-    name_patterns = [
-        r"accept(\s+all)?", r"accept\s+cookies", r"allow\s+all", r"i\s*agree", r"agree",
-        r"got\s*it", r"ok(ay)?", r"continue", r"consent", r"yes[, ]?i\s*agree",
-        r"acept(ar|o)(\s+todo|\s+todas)?", r"accepter(\s+tout|\s+les\s+cookies)?",
-        r"alle(s)?\s+akzeptieren|zustimmen", r"accetta(\s+tutto|\s+i\s+cookie)?",
-        r"aceitar(\s+todos|\s+os\s+cookies)?", r"принять(\s+все)?|согласен",
-        r"接受(全部)?|同意|允許|允许", r"同意する|同意して続行",
-        r"acceptez?", r"accepteer", r"godta", r"tillåt|tillad", r"hyväksy",
-    ]
-    negative_words = re.compile(r"reject|decline|deny|manage|settings|custom|preferences|necessary|essential only|only necessary", re.I)
-    # Common CMP selectors (OneTrust, Cookiebot, Quantcast, TrustArc, Didomi, Usercentrics)
-    css_buttons = [
-        "#onetrust-accept-btn-handler",
-        "button[aria-label*='Accept']",
-        "button[title*='Accept']",
-        "#CybotCookiebotDialogBodyButtonAccept",
-        "#CybotCookiebotDialogBodyLevelButtonLevelOptinAllowAll",
-        ".qc-cmp2-summary-buttons .qc-cmp2-accept-all",
-        ".qc-cmp2-footer .qc-cmp2-accept-all",
-        "#truste-consent-button, .trustarc-agree, .truste-button1",
-        ".didomi-accept-button, #didomi-notice-agree-button",
-        "button[data-testid='uc-accept-all-button']",
-    ]
- 
-    # 1) By accessible role + (partial) name
-    for pat in name_patterns:
-        try:
-            loc = page.get_by_role("button", name=re.compile(pat, re.I))
-            if loc.count() > 0 and loc.first.is_visible():
-                text = (loc.first.inner_text(timeout=timeout_ms) or "")
-                if not negative_words.search(text):
-                    loc.first.click(timeout=timeout_ms)
-                    page.wait_for_timeout(300)
-                    return True
-        except Exception:
-            pass
-        # Fallback: any element containing text
-        try:
-            loc = page.get_by_text(re.compile(pat, re.I))
-            if loc.count() > 0 and loc.first.is_visible():
-                text = (loc.first.inner_text(timeout=timeout_ms) or "")
-                if not negative_words.search(text):
-                    try:
-                        loc.first.click(timeout=timeout_ms)
-                    except Exception:
-                        loc.first.locator("xpath=ancestor-or-self::*[@role='button' or self::button or self::a or @onclick or @tabindex]").first.click(timeout=timeout_ms)
-                    page.wait_for_timeout(300)
-                    return True
-        except Exception:
-            pass
- 
-    # 2) By CSS selectors (page)
-    for sel in css_buttons:
-        try:
-            page.locator(sel).first.click(timeout=timeout_ms)
-            page.wait_for_timeout(300)
-            return True
-        except Exception:
-            pass
- 
-    # 3) Try inside iframes (CMPs often sit in an iframe)
-    for frame in page.frames:
-        for pat in name_patterns:
-            try:
-                loc = frame.get_by_role("button", name=re.compile(pat, re.I))
-                if loc.count() > 0 and loc.first.is_visible():
-                    text = (loc.first.inner_text(timeout=timeout_ms) or "")
-                    if not negative_words.search(text):
-                        loc.first.click(timeout=timeout_ms)
-                        page.wait_for_timeout(300)
-                        return True
-            except Exception:
-                pass
-            try:
-                loc = frame.get_by_text(re.compile(pat, re.I))
-                if loc.count() > 0 and loc.first.is_visible():
-                    text = (loc.first.inner_text(timeout=timeout_ms) or "")
-                    if not negative_words.search(text):
-                        loc.first.click(timeout=timeout_ms)
-                        page.wait_for_timeout(300)
-                        return True
-            except Exception:
-                pass
-        for sel in css_buttons:
-            try:
-                frame.locator(sel).first.click(timeout=timeout_ms)
-                page.wait_for_timeout(300)
-                return True
-            except Exception:
-                pass
- 
-    return False
- 
-def _hide_banner_with_css(page):
-    """
-    Inject CSS to hide known banner containers as a last resort.
-    """
-    hide_selectors = [
-        "#onetrust-banner-sdk", "#onetrust-consent-sdk", ".ot-sdk-container",
-        "#CybotCookiebotDialog", "#CybotCookiebotDialogBody",
-        "#qc-cmp2-container", ".qc-cmp2-container",
-        "#truste-consent-content", "#truste-consent-banner",
-        "#didomi-host", ".didomi-popup", ".didomi-consent-popup",
-        "#usercentrics-root", "[data-testid='usercentrics-root']",
-        "[id^='sp_message_container_']","[id^='sp_message_iframe_']",
-        ".cookie-banner", "#cookie-banner", "#cookie-consent", ".cc-window",
-        ".cky-consent-container", ".cookie-consent", ".cookie-consent-container"
-    ]
-    css = ", ".join(hide_selectors) + " { display: none !important; visibility: hidden !important; opacity: 0 !important; }"
-    try:
-        page.add_style_tag(content=css)
-        # Some banners lock scroll; re-enable
-        page.evaluate("document.documentElement.style.overflow='auto'; document.body.style.overflow='auto';")
-    except Exception:
-        pass
- 
-def get_screenshot_md(
-    url: str,
-    # artifacts_dir: str = "artifacts",
-    # *,
-    viewport: Tuple[int, int] = (1920, 1080),
-    full_page: bool = True,
-    wait_for_ms: int = 60000,
-    timeout_ms: int = 500_000,
-    only_main_content: bool = True,
-    remove_base64_images: bool = True,
-    progress_callback=None,
-) -> Tuple[str, str]:
-    """
-    Open `url` with your installed Microsoft Edge, dismiss/hide cookie banners,
-    then save:
-      - artifacts/page.md
-      - artifacts/screenshot.png
-    Returns (markdown_path, screenshot_path).
-    """
-    # out = Path(artifacts_dir)
-    # out.mkdir(parents=True, exist_ok=True)
-    # md_path = out / "page_test.md"
-    # shot_path = out / "screenshot_test.png"
- 
-    with sync_playwright() as p:
-        # Launch Playwright's Chromium browser (installed via playwright install)
-        if progress_callback:
-            progress_callback("🚀 Launching Browser", "Starting browser automation...")
-        try:
-            browser = p.chromium.launch(headless=True)
-        except Exception as e:
-            raise RuntimeError(f"Failed to launch Chromium browser: {e}")
-        # page = browser.new_page(viewport={"width": viewport[0], "height": viewport[1]})
-
-
-        # Create browser context with English language
-        context = browser.new_context(
-            viewport={"width": viewport[0], "height": viewport[1]},
-            locale="en-US"
-        )
-        page = context.new_page()
-        
-        # Set Accept-Language header for English
-        page.set_extra_http_headers({
-            'Accept-Language': 'en-US,en;q=0.9'
-        })
-
-        if progress_callback:
-            progress_callback("🌐 Loading Website", "Navigating to the target URL...")
-        try:
-            page.goto(url, wait_until="networkidle", timeout=timeout_ms)
-        except PWTimeout:
-            browser.close()
-            raise RuntimeError("Navigation timeout. The site may be slow or blocking headless browsers.")
-
-        # Give late assets a moment (mirrors your curl waitFor)
-        if progress_callback:
-            progress_callback("⏳ Waiting for Content", "Allowing page to fully load...")
-        page.wait_for_timeout(wait_for_ms)
-
-        # Try to accept cookies; if not, hide banner containers
-        if progress_callback:
-            progress_callback("🍪 Handling Cookies", "Dismissing cookie banners and popups...")
-        clicked = _try_click_common_cookie_buttons(page, timeout_ms=1500)
-        if not clicked:
-            _hide_banner_with_css(page)
-            # tiny pause to reflow
-            page.wait_for_timeout(2000)
-
-        # Now take the screenshot (banner should be gone)
-        if progress_callback:
-            progress_callback("📸 Taking Screenshot", "Capturing full page screenshot...")
-        screenshot = page.screenshot(full_page=full_page) #path=str(shot_path), full_page=full_page)
-
-        # Get rendered HTML for Markdown conversion
-        if progress_callback:
-            progress_callback("📄 Extracting Content", "Converting HTML to markdown...")
-        html = page.content()
-        browser.close()
- 
-    # HTML → Markdown
-    source_html = html
-    if only_main_content:
-        try:
-            doc = Document(source_html)
-            content_html = doc.summary(html_partial=True)
-        except Exception:
-            content_html = source_html
-    else:
-        content_html = source_html
- 
-    soup = BeautifulSoup(content_html, "lxml")
-    for t in soup(["script", "style", "noscript"]):
-        t.extract()
- 
-    if remove_base64_images:
-        for img in soup.find_all("img", src=True):
-            if img["src"].startswith("data:image/"):
-                img.decompose()
- 
-    markdown = md(str(soup), heading_style="ATX")
-    #md_path.write_text(markdown, encoding="utf-8")
-
-    if progress_callback:
-        progress_callback("✅ Content Ready", "Screenshot and markdown extraction complete!")
-
-    return screenshot,markdown
- 
-# Example:
-# out = Path("artifacts")
-# out.mkdir(parents=True, exist_ok=True)
-# md_path = out / "page_test.md"
-# shot_path = out / "screenshot_test.png"
-
-# shot_file, md_file = get_screenshot_md("https://www.sky.com")
-# md_path.write_text(md_file, encoding="utf-8")
-
-# print(md_file)
-# img = Image.open(io.BytesIO(shot_file))
-# img.save(shot_path)
-
+from pathlib import Path
+from typing import Tuple, Optional
+import os, re,io,base64,gzip,json
+import asyncio
+import atexit
+import threading
+from playwright.sync_api import sync_playwright, TimeoutError as PWTimeout
+from readability import Document
+from bs4 import BeautifulSoup
+from markdownify import MarkdownConverter
+from PIL import Image
+
+# Fix for Microsoft Store Python subprocess issues
+if os.name == 'nt':  # Windows
+    asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+ 
+def _find_edge_exe() -> Optional[str]:
+    """Try to locate Edge; override by setting EDGE_PATH."""
+    if os.getenv("EDGE_PATH") and Path(os.getenv("EDGE_PATH")).exists():
+        return os.getenv("EDGE_PATH")
+    candidates = []
+    pf = os.environ.get("PROGRAMFILES")
+    if pf:    candidates.append(Path(pf) / "Microsoft" / "Edge" / "Application" / "msedge.exe")
+    pfx = os.environ.get("PROGRAMFILES(X86)")
+    if pfx:   candidates.append(Path(pfx) / "Microsoft" / "Edge" / "Application" / "msedge.exe")
+    local = os.environ.get("LOCALAPPDATA")
+    if local: candidates.append(Path(local) / "Microsoft" / "Edge" / "Application" / "msedge.exe")
+    for c in candidates:
+        if c.exists(): return str(c)
+    return None
+ 
+# Common cookie-accept button texts and multilingual variants (regex,
+# partial match), compiled once — the click helper used to re-compile each
+# pattern per frame on every call
+_COOKIE_NAME_PATTERNS = tuple(re.compile(p, re.I) for p in (
+    r"accept(\s+all)?", r"accept\s+cookies", r"allow\s+all", r"i\s*agree", r"agree",
+    r"got\s*it", r"ok(ay)?", r"continue", r"consent", r"yes[, ]?i\s*agree",
+    r"acept(ar|o)(\s+todo|\s+todas)?", r"accepter(\s+tout|\s+les\s+cookies)?",
+    r"alle(s)?\s+akzeptieren|zustimmen", r"accetta(\s+tutto|\s+i\s+cookie)?",
+    r"aceitar(\s+todos|\s+os\s+cookies)?", r"принять(\s+все)?|согласен",
+    r"接受(全部)?|同意|允許|允许", r"同意する|同意して続行",
+    r"acceptez?", r"accepteer", r"godta", r"tillåt|tillad", r"hyväksy",
+))
+# All accept patterns folded into one alternation so matching an element's
+# text is a single regex test rather than one per pattern
+_COOKIE_COMBINED_ACCEPT_PATTERN = "|".join(f"({p.pattern})" for p in _COOKIE_NAME_PATTERNS)
+_COOKIE_NEGATIVE_WORDS = re.compile(r"reject|decline|deny|manage|settings|custom|preferences|necessary|essential only|only necessary", re.I)
+# Common CMP selectors (OneTrust, Cookiebot, Quantcast, TrustArc, Didomi, Usercentrics)
+_COOKIE_CSS_BUTTONS = (
+    "#onetrust-accept-btn-handler",
+    "button[aria-label*='Accept']",
+    "button[title*='Accept']",
+    "#CybotCookiebotDialogBodyButtonAccept",
+    "#CybotCookiebotDialogBodyLevelButtonLevelOptinAllowAll",
+    ".qc-cmp2-summary-buttons .qc-cmp2-accept-all",
+    ".qc-cmp2-footer .qc-cmp2-accept-all",
+    "#truste-consent-button, .trustarc-agree, .truste-button1",
+    ".didomi-accept-button, #didomi-notice-agree-button",
+    "button[data-testid='uc-accept-all-button']",
+)
+
+# Process-wide Playwright/browser singleton: Chromium cold-start costs
+# 500ms-2s per launch, while a fresh context per URL is ~10ms and still
+# gives per-URL cookie/cache isolation
+_PW = None
+_BROWSER = None
+_BROWSER_LOCK = threading.Lock()
+
+def _get_browser():
+    """Launch the shared headless Chromium on first use and reuse it."""
+    global _PW, _BROWSER
+    with _BROWSER_LOCK:
+        if _BROWSER is None or not _BROWSER.is_connected():
+            _PW = sync_playwright().start()
+            _BROWSER = _PW.chromium.launch(headless=True)
+        return _BROWSER
+
+def _shutdown_browser():
+    global _PW, _BROWSER
+    with _BROWSER_LOCK:
+        try:
+            if _BROWSER is not None:
+                _BROWSER.close()
+            if _PW is not None:
+                _PW.stop()
+        except Exception:
+            pass
+        _BROWSER = None
+        _PW = None
+
+atexit.register(_shutdown_browser)
+
+# One in-page pass over candidate buttons per frame: each locator
+# count()/is_visible()/inner_text()/click() is a separate driver
+# round-trip, and the old per-pattern loops ran hundreds of them
+_COOKIE_CLICK_JS = """
+(args) => {
+    const accept = new RegExp(args.accept, 'i');
+    const negative = new RegExp(args.negative, 'i');
+    const visible = el => el && el.offsetParent !== null;
+
+    // 1) Buttons/links whose text matches an accept pattern; one combined
+    // alternation means a single pass over the candidates
+    const candidates = document.querySelectorAll(
+        "button, a, [role='button'], input[type='button'], input[type='submit']");
+    for (const el of candidates) {
+        const text = (el.innerText || el.value || '').trim();
+        if (!text || text.length > 120 || !visible(el)) continue;
+        if (accept.test(text) && !negative.test(text)) {
+            el.click();
+            return true;
+        }
+    }
+
+    // 2) Known CMP selectors
+    for (const sel of args.css) {
+        let el;
+        try { el = document.querySelector(sel); } catch (e) { continue; }
+        if (visible(el)) {
+            el.click();
+            return true;
+        }
+    }
+    return false;
+}
+"""
+
+def _try_click_common_cookie_buttons(page, timeout_ms=1500) -> bool:
+    """
+    Try the obvious 'accept' buttons (page + iframes).
+    Returns True if something got clicked.
+    """
+    args = {
+        "accept": _COOKIE_COMBINED_ACCEPT_PATTERN,
+        "negative": _COOKIE_NEGATIVE_WORDS.pattern,
+        "css": list(_COOKIE_CSS_BUTTONS),
+    }
+
+    # page.frames starts with the main frame, so this covers the page and
+    # the iframes CMPs usually render into with one evaluate each
+    for frame in page.frames:
+        try:
+            if frame.evaluate(_COOKIE_CLICK_JS, args):
+                page.wait_for_timeout(300)
+                return True
+        except Exception:
+            pass
+
+    return False
+ 
+# Known banner containers, joined into one CSS rule at import time
+_BANNER_HIDE_SELECTORS = (
+    "#onetrust-banner-sdk", "#onetrust-consent-sdk", ".ot-sdk-container",
+    "#CybotCookiebotDialog", "#CybotCookiebotDialogBody",
+    "#qc-cmp2-container", ".qc-cmp2-container",
+    "#truste-consent-content", "#truste-consent-banner",
+    "#didomi-host", ".didomi-popup", ".didomi-consent-popup",
+    "#usercentrics-root", "[data-testid='usercentrics-root']",
+    "[id^='sp_message_container_']","[id^='sp_message_iframe_']",
+    ".cookie-banner", "#cookie-banner", "#cookie-consent", ".cc-window",
+    ".cky-consent-container", ".cookie-consent", ".cookie-consent-container"
+)
+_BANNER_HIDE_CSS = ", ".join(_BANNER_HIDE_SELECTORS) + " { display: none !important; visibility: hidden !important; opacity: 0 !important; }"
+
+# Installed with add_init_script so the style exists before the page
+# renders and known banners never paint (documentElement may not exist
+# yet at script time, hence the observer fallback)
+_BANNER_HIDE_INIT_JS = """
+(() => {
+    const css = %s;
+    const add = () => {
+        if (!document.documentElement) return false;
+        const s = document.createElement('style');
+        s.textContent = css;
+        document.documentElement.appendChild(s);
+        return true;
+    };
+    if (!add()) {
+        new MutationObserver((records, obs) => {
+            if (add()) obs.disconnect();
+        }).observe(document, { childList: true });
+    }
+})();
+""" % json.dumps(_BANNER_HIDE_CSS)
+
+def _hide_banner_with_css(page):
+    """
+    Inject CSS to hide known banner containers as a last resort.
+    """
+    try:
+        page.add_style_tag(content=_BANNER_HIDE_CSS)
+        # Some banners lock scroll; re-enable
+        page.evaluate("document.documentElement.style.overflow='auto'; document.body.style.overflow='auto';")
+    except Exception:
+        pass
+ 
+def get_screenshot_md(
+    url: str,
+    # artifacts_dir: str = "artifacts",
+    # *,
+    viewport: Tuple[int, int] = (1920, 1080),
+    full_page: bool = True,
+    capture_screenshot: bool = True,
+    wait_for_ms: int = 500,
+    timeout_ms: int = 500_000,
+    only_main_content: bool = True,
+    remove_base64_images: bool = True,
+    progress_callback=None,
+) -> Tuple[Optional[bytes], str]:
+    """
+    Open `url` with your installed Microsoft Edge, dismiss/hide cookie banners,
+    then save:
+      - artifacts/page.md
+      - artifacts/screenshot.png
+    Returns (markdown_path, screenshot_path).
+    """
+    # out = Path(artifacts_dir)
+    # out.mkdir(parents=True, exist_ok=True)
+    # md_path = out / "page_test.md"
+    # shot_path = out / "screenshot_test.png"
+ 
+    # Reuse the shared Chromium browser (installed via playwright install);
+    # only the first call pays the launch cost
+    if progress_callback:
+        progress_callback("🚀 Launching Browser", "Starting browser automation...")
+    try:
+        browser = _get_browser()
+    except Exception as e:
+        raise RuntimeError(f"Failed to launch Chromium browser: {e}")
+
+    # Create browser context with English language
+    context = browser.new_context(
+        viewport={"width": viewport[0], "height": viewport[1]},
+        locale="en-US"
+    )
+    try:
+        # Screenshots need images and stylesheets, but videos, fonts and
+        # websocket/other traffic only cost bandwidth and goto latency
+        context.route(
+            "**/*",
+            lambda route: route.abort()
+            if route.request.resource_type in ("media", "font", "other")
+            else route.continue_()
+        )
+
+        # Hide known CMP containers before the page renders so banners
+        # never paint; clicking below remains for actual consent
+        context.add_init_script(_BANNER_HIDE_INIT_JS)
+
+        page = context.new_page()
+
+        # Set Accept-Language header for English
+        page.set_extra_http_headers({
+            'Accept-Language': 'en-US,en;q=0.9'
+        })
+
+        if progress_callback:
+            progress_callback("🌐 Loading Website", "Navigating to the target URL...")
+        try:
+            # domcontentloaded instead of networkidle: sites with analytics
+            # beacons or long-poll connections may never go network-idle
+            page.goto(url, wait_until="domcontentloaded", timeout=timeout_ms)
+        except PWTimeout:
+            raise RuntimeError("Navigation timeout. The site may be slow or blocking headless browsers.")
+
+        # Give late assets a moment, but treat network-idle as best effort
+        # rather than a blanket sleep
+        if progress_callback:
+            progress_callback("⏳ Waiting for Content", "Allowing page to fully load...")
+        try:
+            page.wait_for_load_state("networkidle", timeout=5000)
+        except PWTimeout:
+            pass
+        page.wait_for_timeout(wait_for_ms)
+
+        # Try to accept cookies; if not, hide banner containers
+        if progress_callback:
+            progress_callback("🍪 Handling Cookies", "Dismissing cookie banners and popups...")
+        clicked = _try_click_common_cookie_buttons(page, timeout_ms=1500)
+        if not clicked:
+            # The init-script CSS already hides known containers; this only
+            # catches late-added inline banners, so a short reflow pause is
+            # enough
+            _hide_banner_with_css(page)
+            page.wait_for_timeout(500)
+
+        # Now take the screenshot (banner should be gone); full-page
+        # rasterization stitches many viewport captures and gets expensive
+        # on tall pages, so markdown-only callers can skip it entirely
+        screenshot = None
+        if capture_screenshot:
+            if progress_callback:
+                progress_callback("📸 Taking Screenshot", "Capturing full page screenshot...")
+            screenshot = page.screenshot(full_page=full_page) #path=str(shot_path), full_page=full_page)
+
+        # Get rendered HTML for Markdown conversion
+        if progress_callback:
+            progress_callback("📄 Extracting Content", "Converting HTML to markdown...")
+        html = page.content()
+    finally:
+        # Close only the per-URL context; the browser stays warm for the
+        # next call
+        context.close()
+
+
+    # HTML → Markdown
+    source_html = html
+    if only_main_content:
+        try:
+            doc = Document(source_html)
+            content_html = doc.summary(html_partial=True)
+        except Exception:
+            content_html = source_html
+    else:
+        content_html = source_html
+ 
+    soup = BeautifulSoup(content_html, "lxml")
+    for t in soup(["script", "style", "noscript"]):
+        t.extract()
+ 
+    if remove_base64_images:
+        for img in soup.find_all("img", src=True):
+            if img["src"].startswith("data:image/"):
+                img.decompose()
+ 
+    # Convert the existing soup directly; round-tripping through str(soup)
+    # would serialize and re-parse the whole document inside markdownify
+    markdown = MarkdownConverter(heading_style="ATX").convert_soup(soup)
+    #md_path.write_text(markdown, encoding="utf-8")
+
+    if progress_callback:
+        progress_callback("✅ Content Ready", "Screenshot and markdown extraction complete!")
+
+    return screenshot,markdown
+ 
+# Example:
+# out = Path("artifacts")
+# out.mkdir(parents=True, exist_ok=True)
+# md_path = out / "page_test.md"
+# shot_path = out / "screenshot_test.png"
+
+# shot_file, md_file = get_screenshot_md("https://www.sky.com")
+# md_path.write_text(md_file, encoding="utf-8")
+
+# print(md_file)
+# img = Image.open(io.BytesIO(shot_file))
+# img.save(shot_path)
+
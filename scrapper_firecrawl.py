@@ -1,10 +1,35 @@
 import os
 import json
 import base64
+import concurrent.futures
+from io import BytesIO
 from pathlib import Path
 import requests
+from PIL import Image
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-def scrapper_url(url,api_url,api_key):
+# Module-level session so repeated Firecrawl scrapes reuse the same TLS connection
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=2, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504])
+))
+
+_EXEC = concurrent.futures.ThreadPoolExecutor(max_workers=4)
+
+
+def scrapper_url_async(url, api_url, api_key, outputs=("screenshot",)):
+    """Run scrapper_url in the background and return a Future
+
+    Firecrawl waits up to 50s per scrape; submitting here lets callers kick
+    the scrape off early and call .result() only where the bytes are needed.
+    """
+    return _EXEC.submit(scrapper_url, url, api_url, api_key, outputs)
+
+
+def scrapper_url(url,api_url,api_key, outputs=("screenshot",)):
 # --- config ---
  # ← replace with your real key, or read from env (recommended)
  
@@ -16,17 +41,23 @@ def scrapper_url(url,api_url,api_key):
         "Content-Type": "application/json",
     }
     
+    # Only ask Firecrawl for what the caller will read; markdown of a full
+    # page can be MBs of render time and response body, and this function
+    # only returns the screenshot by default
+    formats = []
+    if "markdown" in outputs:
+        formats.append("markdown")
+    if "screenshot" in outputs:
+        formats.append({
+            "type": "screenshot",
+            "fullPage": True,
+            "quality": 85,
+            "viewport": {"width": 1366, "height": 1000},
+        })
+
     payload = {
         "url": f"{url}",
-        "formats": [
-            "markdown",
-            {
-                "type": "screenshot",
-                "fullPage": True,
-                "quality": 100,
-                "viewport": {"width": 1366, "height": 1000},
-            },
-        ],
+        "formats": formats,
         # 'actions': [
         # { 'type': 'wait', 'milliseconds': 50000 },  # Wait for cookie banner to appear
         # # Try multiple selectors - Firecrawl will use the first one that matches
@@ -53,14 +84,15 @@ def scrapper_url(url,api_url,api_key):
         "mobile": False,
         "skipTlsVerification": True,
         "timeout": 100000,
-        "removeBase64Images": False,
+        "removeBase64Images": "markdown" not in outputs,
         "blockAds": True,
         "proxy": "auto",
         "storeInCache": False,
     }
     
     # --- call the API ---
-    resp = requests.post(api_url, headers=headers, json=payload)
+    # Firecrawl itself waits up to ~100s per the payload, so allow a generous read timeout
+    resp = _SESSION.post(api_url, headers=headers, json=payload, timeout=(10, 180))
     data = resp.json()
     # # (optional) save raw response for debugging
     # (ARTIFACTS / "firecrawl_response.json").write_text(
@@ -73,5 +105,24 @@ def scrapper_url(url,api_url,api_key):
     # md_path.write_text(markdown, encoding="utf-8")
 
     screenshot_url = data.get("screenshot") or (data.get("data") or {}).get("screenshot")
-    return screenshot_url
+    if not screenshot_url:
+        return None
+
+    # Re-encode the quality-100 capture as WebP before it reaches storage:
+    # typically 3-5x fewer bytes with no visible difference, which shrinks
+    # both the hypothesis commits and later image loads
+    try:
+        if screenshot_url.startswith("data:"):
+            raw = base64.b64decode(screenshot_url.split(",", 1)[1])
+        else:
+            resp = _SESSION.get(screenshot_url, timeout=(10, 60))
+            resp.raise_for_status()
+            raw = resp.content
+        img = Image.open(BytesIO(raw))
+        out = BytesIO()
+        img.save(out, format="WEBP", quality=85, method=6)
+        return out.getvalue()
+    except Exception:
+        # Transcode is best-effort; hand back the URL as before on failure
+        return screenshot_url
 